@@ -29,8 +29,10 @@ from immanuel.tools import calculate, convert, date, ephemeris, forecast, midpoi
 
 class Subject:
     """ Simple class to model a chart subject - essentially just
-    a time and place. """
-    def __init__(self, date_time: datetime | str, latitude: float | list | tuple | str, longitude: float | list | tuple | str, time_is_dst: bool = None) -> None:
+    a time and place. A Julian date can be passed in place of a date/time,
+    in which case it is used as-is rather than re-derived from the
+    localized date/time. """
+    def __init__(self, date_time: datetime | float | str, latitude: float | list | tuple | str, longitude: float | list | tuple | str, time_is_dst: bool = None) -> None:
         self.latitude, self.longitude = (convert.to_dec(v) for v in (latitude, longitude))
         self.time_is_dst = time_is_dst
         self.date_time = date.to_datetime(
@@ -40,7 +42,7 @@ class Subject:
                 is_dst=time_is_dst
             )
         self.date_time_ambiguous = date.ambiguous(self.date_time) and time_is_dst is None
-        self.julian_date = date.to_jd(self.date_time)
+        self.julian_date = date_time if isinstance(date_time, float) else date.to_jd(self.date_time)
 
 
 class Chart:
@@ -447,8 +449,9 @@ class Composite(Chart):
 class Transits(Chart):
     """ Chart of the moment for the given coordinates. Structurally identical
     to the natal chart. Coordinates default to those specified in settings. """
-    def __init__(self, latitude: float | list | tuple | str = settings.default_latitude, longitude: float | list | tuple | str = settings.default_longitude, aspects_to: Chart = None) -> None:
-        lat, lon = (convert.to_dec(v) for v in (latitude, longitude))
+    def __init__(self, latitude: float | list | tuple | str = None, longitude: float | list | tuple | str = None, aspects_to: Chart = None) -> None:
+        lat = convert.to_dec(latitude if latitude is not None else settings.default_latitude)
+        lon = convert.to_dec(longitude if longitude is not None else settings.default_longitude)
         timezone = date.timezone(lat, lon)
         date_time = datetime.now(tz=ZoneInfo(timezone))
         self._native = Subject(date_time, lat, lon)
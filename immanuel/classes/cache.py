@@ -5,6 +5,8 @@
 
     Basic wrapper for the functools @cache decorator. This way we can keep
     track of which functions are being cached and can easily clear them.
+    Functions keyed on arbitrary floats can use the size-limited
+    @bounded_cache instead, so their memos do not grow without limit.
 
 """
 
@@ -24,3 +26,12 @@ def cache(func: Callable) -> Callable:
     cached_func = functools.cache(func)
     FunctionCache.registry.append(cached_func)
     return cached_func
+
+
+def bounded_cache(maxsize: int) -> Callable:
+    def decorator(func: Callable) -> Callable:
+        cached_func = functools.lru_cache(maxsize=maxsize)(func)
+        FunctionCache.registry.append(cached_func)
+        return cached_func
+
+    return decorator
@@ -94,11 +94,11 @@ class Coordinates:
 
 
 class DateTime:
-    def __init__(self, dt: datetime | float, armc: dict | float = None, latitude: float = None, longitude: float = None, time_is_dst: bool = None) -> None:
+    def __init__(self, dt: datetime | float, armc: dict | float = None, latitude: float = None, longitude: float = None, time_is_dst: bool = None, julian: float = None) -> None:
         self.datetime = date.to_datetime(dt, latitude, longitude)
         self.timezone = self.datetime.tzname()
         self.ambiguous = date.ambiguous(self.datetime) and time_is_dst is None
-        self.julian = date.to_jd(dt)
+        self.julian = julian if julian is not None else date.to_jd(dt)
         self.deltat = ephemeris.deltat(self.julian)
 
         if armc is not None:
@@ -305,6 +305,7 @@ class Subject:
                 latitude=subject.latitude,
                 longitude=subject.longitude,
                 time_is_dst=subject.time_is_dst,
+                julian=subject.julian_date,
             )
         self.coordinates = Coordinates(
                 latitude=subject.latitude,
@@ -18,26 +18,38 @@ from immanuel.setup import settings
 from immanuel.tools import position
 
 
-def between(object1: dict, object2: dict) -> dict:
-    """ Returns any aspect between the two passed objects. """
+def between(object1: dict, object2: dict, aspect_rules: dict = None, orbs: dict = None) -> dict:
+    """ Returns any aspect between the two passed objects. The aspect rules
+    and orbs default to the current settings, but can be passed in by
+    callers checking many pairs so these are only built once. """
     active, passive = (object1, object2) if abs(object1['speed']) > abs(object2['speed']) else (object2, object1)
 
+    if aspect_rules is None:
+        aspect_rules = settings.aspect_rules
+
+    if orbs is None:
+        orbs = settings.orbs
+
+    # Rules, orbs and distance do not depend on the aspect being checked
+    active_aspect_rule = aspect_rules[active['index']] if active['index'] in aspect_rules else settings.default_aspect_rule
+    passive_aspect_rule = aspect_rules[passive['index']] if passive['index'] in aspect_rules else settings.default_aspect_rule
+
+    active_orbs = orbs[active['index']] if active['index'] in orbs else None
+    passive_orbs = orbs[passive['index']] if passive['index'] in orbs else None
+
+    distance = swe.difdeg2n(passive['lon'], active['lon'])
+
     for aspect in settings.aspects:
         # Check aspect rules
-        active_aspect_rule = settings.aspect_rules[active['index']] if active['index'] in settings.aspect_rules else settings.default_aspect_rule
-        passive_aspect_rule = settings.aspect_rules[passive['index']] if passive['index'] in settings.aspect_rules else settings.default_aspect_rule
-
         if aspect not in active_aspect_rule['initiate'] or aspect not in passive_aspect_rule['receive']:
             return None
 
         # Get orbs
-        active_orb = settings.orbs[active['index']][aspect] if active['index'] in settings.orbs else settings.default_orb
-        passive_orb = settings.orbs[passive['index']][aspect] if passive['index'] in settings.orbs else settings.default_orb
+        active_orb = active_orbs[aspect] if active_orbs is not None else settings.default_orb
+        passive_orb = passive_orbs[aspect] if passive_orbs is not None else settings.default_orb
         orb = ((active_orb + passive_orb) / 2) if settings.orb_calculation == calc.MEAN else max(active_orb, passive_orb)
 
         # Look for an aspect
-        distance = swe.difdeg2n(passive['lon'], active['lon'])
-
         if aspect-orb <= abs(distance) <= aspect+orb:
             # Work out aspect information
             aspect_orb = abs(distance) - aspect
@@ -60,18 +72,24 @@ def between(object1: dict, object2: dict) -> dict:
     return None
 
 
-def for_object(object: dict, objects: dict, exclude_same: bool = True) -> dict:
+def for_object(object: dict, objects: dict, exclude_same: bool = True, aspect_rules: dict = None, orbs: dict = None) -> dict:
     """ Returns all chart objects aspecting the passed chart object. If two
     separate sets of objects are being compared (eg. synastry) then
     exclude_self can be set to False to find aspects between the same
     object in both charts. """
     aspects = {}
 
+    if aspect_rules is None:
+        aspect_rules = settings.aspect_rules
+
+    if orbs is None:
+        orbs = settings.orbs
+
     for index, check_object in objects.items():
         if exclude_same and index == object['index']:
             continue
 
-        aspect = between(object, check_object)
+        aspect = between(object, check_object, aspect_rules, orbs)
 
         if aspect is not None:
             aspects[check_object['index']] = aspect
@@ -82,9 +100,10 @@ def for_object(object: dict, objects: dict, exclude_same: bool = True) -> dict:
 def all(objects: dict, exclude_same: bool = True) -> dict:
     """ Returns all aspects between the passed chart objects. """
     aspects = {}
+    aspect_rules, orbs = settings.aspect_rules, settings.orbs
 
     for index, object in objects.items():
-        object_aspects = for_object(object, objects, exclude_same)
+        object_aspects = for_object(object, objects, exclude_same, aspect_rules, orbs)
 
         if object_aspects:
             aspects[index] = object_aspects
@@ -96,9 +115,10 @@ def by_type(objects: dict, exclude_same: bool = True) -> dict:
     """ Returns all aspects between the passed chart objects keyed by
     aspect type. """
     aspects = {}
+    aspect_rules, orbs = settings.aspect_rules, settings.orbs
 
     for object in objects.values():
-        object_aspects = for_object(object, objects, exclude_same)
+        object_aspects = for_object(object, objects, exclude_same, aspect_rules, orbs)
 
         if object_aspects:
             for object_aspect in object_aspects.values():
@@ -114,9 +134,10 @@ def by_type(objects: dict, exclude_same: bool = True) -> dict:
 def synastry(objects1: dict, objects2: dict, exclude_same: bool = False) -> dict:
     """ Returns all aspects between the two sets of passed chart objects. """
     aspects = {}
+    aspect_rules, orbs = settings.aspect_rules, settings.orbs
 
     for index, object in objects1.items():
-        object_aspects = for_object(object, objects2, exclude_same)
+        object_aspects = for_object(object, objects2, exclude_same, aspect_rules, orbs)
 
         if object_aspects:
             aspects[index] = object_aspects
@@ -356,9 +356,15 @@ class StaticSingleton(type):
     _instance = BaseSettings()
 
     def reset(cls) -> None:
-        """ Reset all settings to default. """
+        """ Reset all settings to default. Swisseph closes its open
+        ephemeris files whenever the path is set, so this is only passed
+        on if the default path differs from the current one. """
+        file_path = StaticSingleton._instance._file_path
         StaticSingleton._instance = BaseSettings()
-        StaticSingleton._instance.set_swe_filepath()
+
+        if StaticSingleton._instance._file_path != file_path:
+            StaticSingleton._instance.set_swe_filepath()
+
         Localize.reset()
 
     def set(cls, values: dict) -> None:
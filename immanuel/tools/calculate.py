@@ -19,10 +19,7 @@ def moon_phase(sun: dict | float, moon: dict | float) -> int:
     """ Returns the moon phase given the positions of the Sun and Moon. """
     sun_lon, moon_lon = (object['lon'] if isinstance(object, dict) else object for object in (sun, moon))
     distance = swe.difdegn(moon_lon, sun_lon)
-
-    for angle in range(45, 361, 45):
-        if distance < angle:
-            return angle
+    return (int(distance // 45) + 1) * 45
 
 
 def is_daytime(sun: dict | float, asc: dict | float) -> bool:
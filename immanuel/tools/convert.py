@@ -16,6 +16,8 @@ import re
 
 import swisseph as swe
 
+from immanuel.classes.cache import bounded_cache, cache
+
 
 FORMAT_TIME = 0
 FORMAT_TIME_OFFSET = 1
@@ -30,10 +32,10 @@ ROUND_SECOND = (3, swe.SPLIT_DEG_ROUND_SEC)
 
 def dms_to_dec(dms: list | tuple) -> float:
     """ Returns the decimal conversion of a D:M:S list. """
-    dec = sum([float(abs(v)) / 60**k for k, v in enumerate(dms[1:])])
-    return dec if dms[0] == '+' else -dec
+    return _dms_to_dec(tuple(dms))
 
 
+@bounded_cache(maxsize=2048)
 def dec_to_dms(dec: float, round_to: tuple = ROUND_SECOND, pad_rounded: bool = False) -> tuple:
     """ Returns the rounded D:M:S conversion of a decimal float. """
     dms = ('-' if dec < 0 else '+', *swe.split_deg(dec, round_to[1])[:round_to[0]])
@@ -46,31 +48,26 @@ def dms_to_string(dms: list | tuple, format: int = FORMAT_DMS, round_to: tuple =
     pad_rounded = True if format in (FORMAT_LAT, FORMAT_LON) or (pad_rounded is None and format != FORMAT_DMS) else pad_rounded
     dms = dec_to_dms(dms_to_dec(dms), round_to, pad_rounded)
 
-    if format == FORMAT_DMS:
-        return _dms_to_string_format_dms(dms)
-    if format == FORMAT_TIME:
-        return _dms_to_string_format_time(dms)
-    if format == FORMAT_TIME_OFFSET:
-        return _dms_to_string_format_time_offset(dms)
-    if format == FORMAT_LAT:
-        return _dms_to_string_format_lat(dms)
-    if format == FORMAT_LON:
-        return _dms_to_string_format_lon(dms)
+    if format in _FORMATTERS:
+        return _FORMATTERS[format](dms)
 
     return ''
 
 
+@cache
 def string_to_dms(string: str, round_to: tuple = ROUND_SECOND, pad_rounded: bool = False) -> tuple:
     """ Takes any string supported by string_to_dec() and returns a
     DMS tuple. """
     return dec_to_dms(string_to_dec(string), round_to, pad_rounded)
 
 
+@bounded_cache(maxsize=2048)
 def dec_to_string(dec: float, format: int = FORMAT_DMS, round_to: tuple = ROUND_SECOND, pad_rounded: bool = None) -> str:
     """ Returns a decimal float as either a D:M:S or a D°M'S" string. """
     return dms_to_string(dec_to_dms(dec, round_to), format, round_to, pad_rounded)
 
 
+@cache
 def string_to_dec(string: str) -> float:
     """ Takes any string format output by dms_to_string() and returns
     a decimal float. """
@@ -122,6 +119,14 @@ def to_string(value: float | list | tuple | str, format: int = FORMAT_DMS, round
     return None
 
 
+@bounded_cache(maxsize=2048)
+def _dms_to_dec(dms: tuple) -> float:
+    """ Cached conversion for dms_to_dec(), which ensures the D:M:S
+    values arrive as a hashable tuple. """
+    dec = sum([float(abs(v)) / 60**k for k, v in enumerate(dms[1:])])
+    return dec if dms[0] == '+' else -dec
+
+
 def _dms_to_string_format_dms(dms: list | tuple) -> str:
     """ Returns DMS in degree/minute/second format. """
     symbols = (u'\N{DEGREE SIGN}', "'", '"')
@@ -161,3 +166,12 @@ def _dms_to_string_format_lat_lon(dms: list | tuple, dir: str) -> str:
 def _is_numeric(value: str) -> bool:
     """ Determine whether a string is numeric. """
     return re.match(r'^-?\d+(?:\.\d+)?$', value)
+
+
+_FORMATTERS = {
+    FORMAT_DMS: _dms_to_string_format_dms,
+    FORMAT_TIME: _dms_to_string_format_time,
+    FORMAT_TIME_OFFSET: _dms_to_string_format_time_offset,
+    FORMAT_LAT: _dms_to_string_format_lat,
+    FORMAT_LON: _dms_to_string_format_lon,
+}
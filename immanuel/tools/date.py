@@ -15,23 +15,36 @@
 """
 
 from datetime import datetime
+from threading import Lock
 from zoneinfo import ZoneInfo
 
 import swisseph as swe
 from dateutil import tz
 from timezonefinder import TimezoneFinder
 
+from immanuel.classes.cache import bounded_cache
 from immanuel.tools import convert
 
 
+_timezone_finder = None
+_timezone_finder_lock = Lock()
+
+
 def ambiguous(dt: datetime) -> bool:
     """ Returns whether an aware datetime is ambiguous. """
     return tz.datetime_ambiguous(dt)
 
 
+@bounded_cache(maxsize=2048)
 def timezone(lat: float, lon: float) -> str:
     """ Returns a timezone string based on decimal lat/lon coordinates. """
-    return TimezoneFinder().timezone_at(lat=lat, lng=lon)
+    global _timezone_finder
+
+    with _timezone_finder_lock:
+        if _timezone_finder is None:
+            _timezone_finder = TimezoneFinder()
+
+        return _timezone_finder.timezone_at(lat=lat, lng=lon)
 
 
 def localize(dt: datetime, lat: float, lon: float, is_dst: bool = None) -> datetime:
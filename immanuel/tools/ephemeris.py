@@ -17,7 +17,7 @@
 import swisseph as swe
 
 from immanuel.const import chart, names
-from immanuel.classes.cache import cache
+from immanuel.classes.cache import bounded_cache, cache
 from immanuel.tools import calculate, find
 from immanuel.classes.localize import _
 
@@ -79,8 +79,8 @@ _SWE = {
 
 def objects(object_list: tuple, jd: float, lat: float = None, lon: float = None, house_system: int = None, part_formula: int = None) -> dict:
     """ Helper function returns a dict of all passed chart objects. """
-    return _objects(
-        object_list=object_list,
+    return dict(_objects(
+        object_list=tuple(object_list),
         jd=jd,
         lat=lat,
         lon=lon,
@@ -88,14 +88,14 @@ def objects(object_list: tuple, jd: float, lat: float = None, lon: float = None,
         part_formula=part_formula,
         armc=None,
         armc_obliquity=None
-    )
+    ))
 
 
 def armc_objects(object_list: tuple, jd: float, armc: float, lat: float = None, lon: float = None, obliquity: float = None, house_system: int = None, part_formula: int = None) -> dict:
     """ Helper function returns a dict of all passed chart objects
     with points & angles calculated from the passed ARMC. """
-    return _objects(
-        object_list=object_list,
+    return dict(_objects(
+        object_list=tuple(object_list),
         jd=jd,
         lat=lat,
         lon=lon,
@@ -103,7 +103,7 @@ def armc_objects(object_list: tuple, jd: float, armc: float, lat: float = None,
         part_formula=part_formula,
         armc=armc,
         armc_obliquity=obliquity
-    )
+    ))
 
 
 def get(index: int | str, jd: float, lat: float = None, lon: float = None, house_system: int = None, part_formula: int = None) -> dict:
@@ -275,8 +275,11 @@ def armc_point(index: int, jd: float, armc: float, lat: float, obliquity: float,
     )
 
 
+@bounded_cache(maxsize=256)
 def _objects(object_list: tuple, jd: float, lat: float, lon: float, house_system: int, part_formula: int, armc: float, armc_obliquity: float) -> dict:
-    """ Function for items() and armc_items(). """
+    """ Function for objects() and armc_objects(). The object list is
+    passed as a tuple so the whole set can be cached - callers hand out a
+    copy of the cached dict so it cannot be altered. """
     objects = {}
 
     for index in object_list:
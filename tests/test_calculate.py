@@ -15,16 +15,16 @@ from immanuel.const import calc, chart
 from immanuel.tools import calculate, convert, date, ephemeris, position
 
 
-@fixture
+@fixture(scope='session')
 def coords():
     # San Diego coords as used by astro.com
     return [convert.string_to_dec(v) for v in ('32n43', '117w09')]
 
-@fixture
+@fixture(scope='session')
 def day_jd(coords):
     return date.to_jd('2000-01-01 10:00', *coords)
 
-@fixture
+@fixture(scope='session')
 def night_jd(coords):
     return date.to_jd('2000-01-01 00:00', *coords)
 
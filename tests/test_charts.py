@@ -15,79 +15,285 @@
 """
 
 from datetime import datetime
+from operator import attrgetter
+from types import MappingProxyType
 from zoneinfo import ZoneInfo
 
-from pytest import fixture
+from pytest import approx, fixture, mark
 
 from immanuel import charts
 from immanuel.classes import wrap
 from immanuel.const import calc, chart, dignities, names
 from immanuel.setup import settings
-from immanuel.tools import convert
-
-
-@fixture
+from immanuel.tools import convert, ephemeris
+
+
+def _frozen(value: object) -> object:
+    # Read-only copy of nested expected data, so no test can alter it
+    if isinstance(value, dict):
+        return MappingProxyType({key: _frozen(item) for key, item in value.items()})
+
+    return value
+
+
+# Expected values for the dob/lat/lon fixtures
+DATE_TIME = datetime.fromisoformat('2000-01-01 10:00 -08:00')
+LATITUDE = convert.string_to_dec('32N43.0')
+LONGITUDE = convert.string_to_dec('117W9.0')
+
+# Julian dates + delta-T tested against astro.com
+NATIVE_JD = 2451545.250739
+PARTNER_JD = 2451957.084075
+SOLAR_RETURN_JD = 2462502.521823
+PROGRESSED_JD = 2451570.719456
+
+# Spot-checks for correct chart data, object, angle & 2nd house
+# positions, aspects and weightings against astro.com
+NATAL = _frozen({
+    'type': chart.NATAL,
+    'shape': calc.BOWL,
+    'moon_phase': calc.THIRD_QUARTER,
+    'sun_sign_longitude': '10°37\'26"',
+    'weightings': (chart.JUPITER, 'fire', 'cardinal', 'first'),
+    'objects': {
+        chart.SUN: (names.PLANETS[chart.SUN], chart.CAPRICORN, (10, 37, 26)),
+        chart.MOON: (names.PLANETS[chart.MOON], chart.SCORPIO, (16, 19, 29)),
+        chart.PART_OF_FORTUNE: (names.POINTS[chart.PART_OF_FORTUNE], chart.CAPRICORN, (11, 18, 41)),
+        chart.ASC: (names.ANGLES[chart.ASC], chart.PISCES, (5, 36, 38)),
+        chart.MC: (names.ANGLES[chart.MC], chart.SAGITTARIUS, (14, 50, 44)),
+    },
+    'houses': {
+        chart.HOUSE2: (names.HOUSES[chart.HOUSE2], chart.ARIES, (17, 59, 40)),
+    },
+    'aspects': {
+        (chart.SUN, chart.MOON): calc.SEXTILE,
+        (chart.MOON, chart.SATURN): calc.OPPOSITION,
+    },
+})
+
+SOLAR_RETURN = _frozen({
+    'type': chart.SOLAR_RETURN,
+    'shape': calc.LOCOMOTIVE,
+    'moon_phase': calc.BALSAMIC,
+    'sun_sign_longitude': '10°37\'26"',
+    'weightings': (chart.JUPITER, 'water', 'fixed', 'second'),
+    'objects': {
+        chart.SUN: (names.PLANETS[chart.SUN], chart.CAPRICORN, (10, 37, 26)),
+        chart.MOON: (names.PLANETS[chart.MOON], chart.SCORPIO, (28, 43, 43)),
+        chart.PART_OF_FORTUNE: (names.POINTS[chart.PART_OF_FORTUNE], chart.TAURUS, (24, 41, 28)),
+        chart.ASC: (names.ANGLES[chart.ASC], chart.CANCER, (6, 35, 11)),
+        chart.MC: (names.ANGLES[chart.MC], chart.PISCES, (20, 21, 6)),
+    },
+    'houses': {
+        chart.HOUSE2: (names.HOUSES[chart.HOUSE2], chart.CANCER, (28, 17, 34)),
+    },
+    'aspects': {
+        (chart.SUN, chart.SATURN): calc.TRINE,
+        (chart.MOON, chart.NEPTUNE): calc.TRINE,
+    },
+})
+
+PROGRESSED = _frozen({
+    'type': chart.PROGRESSED,
+    'shape': calc.LOCOMOTIVE,
+    'moon_phase': calc.DISSEMINATING,
+    'sun_sign_longitude': '06°33\'41"',
+    'weightings': (chart.VENUS, 'earth', 'cardinal', 'third'),
+    'objects': {
+        chart.SUN: (names.PLANETS[chart.SUN], chart.AQUARIUS, (6, 33, 41)),
+        chart.MOON: (names.PLANETS[chart.MOON], chart.LIBRA, (23, 50, 57)),
+        chart.PART_OF_FORTUNE: (names.POINTS[chart.PART_OF_FORTUNE], chart.CAPRICORN, (0, 17, 45)),
+        chart.ASC: (names.ANGLES[chart.ASC], chart.ARIES, (13, 0, 29)),
+        chart.MC: (names.ANGLES[chart.MC], chart.CAPRICORN, (7, 57, 7)),
+    },
+    'houses': {
+        chart.HOUSE2: (names.HOUSES[chart.HOUSE2], chart.TAURUS, (18, 52, 16)),
+    },
+    'aspects': {
+        (chart.SUN, chart.SATURN): calc.SQUARE,
+        (chart.MOON, chart.URANUS): calc.TRINE,
+    },
+})
+
+COMPOSITE = _frozen({
+    'type': chart.COMPOSITE,
+    'shape': None,
+    'moon_phase': calc.THIRD_QUARTER,
+    'sun_sign_longitude': '04°17\'35"',
+    'weightings': (chart.JUPITER, 'earth', 'fixed', 'first'),
+    'objects': {
+        chart.SUN: (names.PLANETS[chart.SUN], chart.AQUARIUS, (4, 17, 35)),
+        chart.MOON: (names.PLANETS[chart.MOON], chart.SAGITTARIUS, (0, 22, 35)),
+        chart.PART_OF_FORTUNE: (names.POINTS[chart.PART_OF_FORTUNE], chart.PISCES, (1, 3, 58)),
+        chart.ASC: (names.ANGLES[chart.ASC], chart.AQUARIUS, (21, 26, 55)),
+        chart.MC: (names.ANGLES[chart.MC], chart.SAGITTARIUS, (6, 7, 28)),
+    },
+    'houses': {
+        chart.HOUSE2: (names.HOUSES[chart.HOUSE2], chart.ARIES, (5, 32, 57)),
+    },
+    'aspects': {
+        (chart.SUN, chart.MOON): calc.SEXTILE,
+        (chart.MOON, chart.VENUS): calc.SEXTILE,
+    },
+})
+
+# Composite angles and cusps under the quirkier house systems, as
+# (sign, sign longitude, declination)
+COMPOSITE_ANGLES = _frozen({
+    chart.ASC: (chart.AQUARIUS, '21°26\'55"', '-14°21\'10"'),
+    chart.MC: (chart.SAGITTARIUS, '06°07\'28"', '-21°19\'44"'),
+})
+
+COMPOSITE_HOUSE_SYSTEMS = _frozen({
+    chart.EQUAL: {
+        **COMPOSITE_ANGLES,
+        chart.HOUSE1: (chart.AQUARIUS, '21°26\'55"', '-14°21\'10"'),
+        chart.HOUSE2: (chart.PISCES, '21°26\'55"', '-03°23\'27"'),
+    },
+    chart.VEHLOW_EQUAL: {
+        **COMPOSITE_ANGLES,
+        chart.HOUSE1: (chart.AQUARIUS, '06°26\'55"', '-18°39\'36"'),
+        chart.HOUSE2: (chart.PISCES, '06°26\'55"', '-09°08\'42"'),
+    },
+    chart.WHOLE_SIGN: {
+        **COMPOSITE_ANGLES,
+        chart.HOUSE1: (chart.AQUARIUS, '00°00\'00"', '-20°08\'58"'),
+        chart.HOUSE2: (chart.PISCES, '00°00\'00"', '-11°28\'17"'),
+    },
+})
+
+# Chart fixtures paired with their expected values
+CHARTS = (
+    ('natal_chart', NATAL),
+    ('solar_return_chart', SOLAR_RETURN),
+    ('progressed_chart', PROGRESSED),
+    ('composite_chart', COMPOSITE),
+)
+
+
+@fixture(scope='session')
 def dob():
     return '2000-01-01 10:00'
 
-@fixture
+@fixture(scope='session')
 def partner_dob():
     return '2001-02-16 06:00'
 
-@fixture
+@fixture(scope='session')
 def lat():
     return '32N43.0'
 
-@fixture
+@fixture(scope='session')
 def partner_lat():
     return '38N35.0'
 
-@fixture
+@fixture(scope='session')
 def lon():
     return '117W9.0'
 
-@fixture
+@fixture(scope='session')
 def partner_lon():
     return '121W30.0'
 
-@fixture
+@fixture(scope='session')
 def native(dob, lat, lon):
     return charts.Subject(dob, lat, lon)
 
-@fixture
+@fixture(scope='session')
 def partner(partner_dob, partner_lat, partner_lon):
     return charts.Subject(partner_dob, partner_lat, partner_lon)
 
-@fixture
+@fixture(scope='session')
+def natal_chart(native):
+    return charts.Natal(native)
+
+@fixture(scope='session')
+def partner_natal_chart(partner):
+    return charts.Natal(partner)
+
+@fixture(scope='session')
+def synastry_chart(native, partner_natal_chart):
+    return charts.Natal(native, aspects_to=partner_natal_chart)
+
+@fixture(scope='session')
+def transits_chart(lat, lon):
+    return charts.Transits(lat, lon)
+
+@fixture(scope='session')
 def julian_date():
     return 2451545.25               # 2000-01-01 18:00 UT
 
-@fixture
+@fixture(scope='session')
 def solar_return_year():
     return 2030
 
-@fixture
+@fixture(scope='session')
 def pdt():
     # We compare against astro.com which assumes UTC for progressions date
     # so we knock 8 hours off midnight 2023-06-21 to account for Pacific Time
     return '2025-06-20 17:00:00'
 
+@fixture(scope='session')
+def solar_return_chart(native, solar_return_year):
+    return charts.SolarReturn(native, solar_return_year)
+
+@fixture(scope='session')
+def progressed_chart(native, pdt):
+    mc_progression_method = settings.mc_progression_method
+    settings.mc_progression_method = calc.NAIBOD
+
+    try:
+        return charts.Progressed(native, pdt)
+    finally:
+        settings.mc_progression_method = mc_progression_method
+
+@fixture(scope='session')
+def composite_chart(native, partner):
+    return charts.Composite(native, partner)
+
+@fixture(scope='session')
+def natal_with_eclipse(native):
+    # Chart data is wrapped eagerly, so the extra object can be removed
+    # from settings as soon as the chart is built
+    settings.objects.append(chart.PRE_NATAL_LUNAR_ECLIPSE)
+
+    try:
+        return charts.Natal(native)
+    finally:
+        settings.objects.remove(chart.PRE_NATAL_LUNAR_ECLIPSE)
+
 
 def teardown_function():
     settings.reset()
 
 
-def test_subject(dob, lat, lon, native, julian_date):
-    date_time = datetime.fromisoformat(f'{dob} -08:00')
-    latitude, longitude = (convert.string_to_dec(v) for v in (lat, lon))
-    assert native.date_time.year == date_time.year
-    assert native.date_time.month == date_time.month
-    assert native.date_time.day == date_time.day
-    assert native.date_time.hour == date_time.hour
-    assert native.date_time.minute == date_time.minute
-    assert native.date_time.second == date_time.second
-    assert native.latitude == latitude
-    assert native.longitude == longitude
+def _jd(date_time: wrap.DateTime) -> float:
+    return round(date_time.julian + date_time.deltat, 6)
+
+
+def _public_vars(wrapped: object) -> dict:
+    return {key: value for key, value in vars(wrapped).items() if not key.startswith('_')}
+
+
+def _longitude(degrees: int, minutes: int, seconds: int) -> approx:
+    return approx(degrees + minutes/60 + seconds/3600, abs=0.5/3600)
+
+
+def _assert_positions(items: dict, expected: dict) -> None:
+    actual = {index: (items[index].name, items[index].sign.name, items[index].sign_longitude.raw) for index in expected}
+    assert actual == {index: (name, names.SIGNS[sign], _longitude(*sign_longitude)) for index, (name, sign, sign_longitude) in expected.items()}
+
+
+def _assert_aspects(aspects: dict, expected: dict) -> None:
+    actual = {(active, passive): aspects[active][passive].aspect if passive in aspects.get(active, {}) else None for active, passive in expected}
+    assert actual == expected
+
+
+def test_subject(lat, lon, native, julian_date):
+    native_date_time = native.date_time
+    assert (native_date_time.year, native_date_time.month, native_date_time.day, native_date_time.hour, native_date_time.minute, native_date_time.second) == (DATE_TIME.year, DATE_TIME.month, DATE_TIME.day, DATE_TIME.hour, DATE_TIME.minute, DATE_TIME.second)
+    assert native.latitude == LATITUDE
+    assert native.longitude == LONGITUDE
     assert native.date_time_ambiguous == False
     assert native.julian_date == julian_date
 
@@ -96,39 +302,60 @@ def test_subject(dob, lat, lon, native, julian_date):
     assert ambiguous_native.date_time_ambiguous == True
 
 
-def test_wrapped_data(native):
-    settings.objects.append(chart.PRE_NATAL_LUNAR_ECLIPSE)
-    natal_chart = charts.Natal(native)
+def test_subject_julian_date(lat, lon, julian_date):
+    native = charts.Subject(julian_date, lat, lon)
+    assert native.julian_date == julian_date
+    assert native.date_time.isoformat() == '2000-01-01T10:00:00-08:00'
+
+    # A JD between whole seconds is kept as-is rather than re-derived
+    # from the second-rounded date/time
+    jd = 2451545.2537
+    native = charts.Subject(jd, lat, lon)
+    native_date_time = charts.Natal(native).native.date_time
+    assert native.julian_date == jd
+    assert native_date_time.julian == jd
+    assert native_date_time.deltat == ephemeris.deltat(jd)
+
+
+def test_wrapped_data(natal_with_eclipse):
+    natal_chart = natal_with_eclipse
 
     # Angle
-    longitude = natal_chart.objects[chart.SUN].longitude
-    assert longitude.raw == 280.6237802656368
-    assert longitude.formatted == '280°37\'26"'
-    assert longitude.direction == '+'
-    assert longitude.degrees == 280
-    assert longitude.minutes == 37
-    assert longitude.seconds == 26
+    assert _public_vars(natal_chart.objects[chart.SUN].longitude) == {
+        'raw': 280.6237802656368,
+        'formatted': '280°37\'26"',
+        'direction': '+',
+        'degrees': 280,
+        'minutes': 37,
+        'seconds': 26,
+    }
 
     # Aspect
     aspect = natal_chart.aspects[chart.SUN][chart.MOON]
-    assert aspect.active == chart.MOON
-    assert aspect.passive == chart.SUN
-    assert aspect.type == names.ASPECTS[calc.SEXTILE]
-    assert aspect.aspect == calc.SEXTILE
-    assert aspect.orb == settings.planet_orbs[calc.SEXTILE]
+    assert attrgetter('active', 'passive', 'type', 'aspect', 'orb')(aspect) == (
+        chart.MOON,
+        chart.SUN,
+        names.ASPECTS[calc.SEXTILE],
+        calc.SEXTILE,
+        settings.planet_orbs[calc.SEXTILE],
+    )
     assert type(aspect.distance) is wrap.Angle                      # Tested separately, just ensure type
     assert type(aspect.difference) is wrap.Angle                    # Tested separately, just ensure type
 
     # AspectCondition
-    assert aspect.condition.associate == True
-    assert aspect.condition.dissociate == False
-    assert aspect.condition.formatted == names.ASPECT_CONDITIONS[calc.ASSOCIATE]
+    assert _public_vars(aspect.condition) == {
+        'associate': True,
+        'dissociate': False,
+        'formatted': names.ASPECT_CONDITIONS[calc.ASSOCIATE],
+    }
 
     # AspectMovement
-    assert aspect.movement.applicative == False
-    assert aspect.movement.exact == False
-    assert aspect.movement.separative == True
-    assert aspect.movement.formatted == names.ASPECT_MOVEMENTS[calc.SEPARATIVE]
+    assert _public_vars(aspect.movement) == {
+        'applicative': False,
+        'exact': False,
+        'separative': True,
+        'formatted': names.ASPECT_MOVEMENTS[calc.SEPARATIVE],
+    }
 
     # Coordinates
     assert type(natal_chart.native.coordinates.latitude) is wrap.Angle      # Tested separately, just ensure type
@@ -137,33 +364,38 @@ def test_wrapped_data(native):
     # DateTime
     date_time = natal_chart.native.date_time
     assert type(date_time.datetime) is datetime
-    assert date_time.timezone == 'PST'
-    assert date_time.ambiguous == False
-    assert date_time.julian == 2451545.25
-    assert date_time.deltat == 0.0007387629899254968
-    assert date_time.sidereal_time == '16:54:13'
+    assert attrgetter('timezone', 'ambiguous', 'julian', 'deltat', 'sidereal_time')(date_time) == (
+        'PST',
+        False,
+        2451545.25,
+        0.0007387629899254968,
+        '16:54:13',
+    )
 
     # MoonPhase
-    moon_phase = natal_chart.moon_phase
-    assert moon_phase.new_moon == False
-    assert moon_phase.waxing_crescent == False
-    assert moon_phase.first_quarter == False
-    assert moon_phase.waxing_gibbous == False
-    assert moon_phase.full_moon == False
-    assert moon_phase.disseminating == False
-    assert moon_phase.third_quarter == True
-    assert moon_phase.balsamic == False
-    assert moon_phase.formatted == names.MOON_PHASES[calc.THIRD_QUARTER]
+    assert _public_vars(natal_chart.moon_phase) == {
+        'new_moon': False,
+        'waxing_crescent': False,
+        'first_quarter': False,
+        'waxing_gibbous': False,
+        'full_moon': False,
+        'disseminating': False,
+        'third_quarter': True,
+        'balsamic': False,
+        'formatted': names.MOON_PHASES[calc.THIRD_QUARTER],
+    }
 
     # Object
     sun = natal_chart.objects[chart.SUN]
-    assert sun.index == chart.SUN
-    assert sun.name == names.PLANETS[chart.SUN]
-    assert sun.distance == 0.9833259257690341
-    assert sun.speed == 1.0194579691359147
-    assert sun.out_of_bounds == False
-    assert sun.in_sect == True
-    assert sun.score == 3
+    assert attrgetter('index', 'name', 'distance', 'speed', 'out_of_bounds', 'in_sect', 'score')(sun) == (
+        chart.SUN,
+        names.PLANETS[chart.SUN],
+        0.9833259257690341,
+        1.0194579691359147,
+        False,
+        True,
+        3,
+    )
 
     assert type(sun.latitude) is wrap.Angle             # Tested separately, just ensure type
     assert type(sun.longitude) is wrap.Angle            # Tested separately, just ensure type
@@ -171,57 +403,71 @@ def test_wrapped_data(native):
     assert type(sun.declination) is wrap.Angle          # Tested separately, just ensure type
 
     # ObjectType
-    assert sun.type.index == chart.PLANET
-    assert sun.type.name == names.OBJECTS[chart.PLANET]
+    assert _public_vars(sun.type) == {
+        'index': chart.PLANET,
+        'name': names.OBJECTS[chart.PLANET],
+    }
 
     # Sign
-    assert sun.sign.number == chart.CAPRICORN
-    assert sun.sign.name == names.SIGNS[chart.CAPRICORN]
-    assert sun.sign.element == names.ELEMENTS[chart.EARTH]
-    assert sun.sign.modality == names.MODALITIES[chart.CARDINAL]
+    assert _public_vars(sun.sign) == {
+        'number': chart.CAPRICORN,
+        'name': names.SIGNS[chart.CAPRICORN],
+        'element': names.ELEMENTS[chart.EARTH],
+        'modality': names.MODALITIES[chart.CARDINAL],
+    }
 
     # Decan
-    assert sun.decan.number == chart.DECAN2
-    assert sun.decan.name == names.DECANS[chart.DECAN2]
+    assert _public_vars(sun.decan) == {
+        'number': chart.DECAN2,
+        'name': names.DECANS[chart.DECAN2],
+    }
 
     # House
-    assert sun.house.index == chart.HOUSE11
-    assert sun.house.number == 11
-    assert sun.house.name == names.HOUSES[chart.HOUSE11]
+    assert _public_vars(sun.house) == {
+        'index': chart.HOUSE11,
+        'number': 11,
+        'name': names.HOUSES[chart.HOUSE11],
+    }
 
     # ObjectMovement
-    assert sun.movement.direct == True
-    assert sun.movement.stationary == False
-    assert sun.movement.retrograde == False
-    assert sun.movement.typical == True
-    assert sun.movement.formatted == names.OBJECT_MOVEMENTS[calc.DIRECT]
+    assert _public_vars(sun.movement) == {
+        'direct': True,
+        'stationary': False,
+        'retrograde': False,
+        'typical': True,
+        'formatted': names.OBJECT_MOVEMENTS[calc.DIRECT],
+    }
 
     # DignityState
-    assert sun.dignities.ruler == False
-    assert sun.dignities.exalted == False
-    assert sun.dignities.triplicity_ruler == False
-    assert sun.dignities.term_ruler == False
-    assert sun.dignities.face_ruler == False
-    assert sun.dignities.mutual_reception_ruler == False
-    assert sun.dignities.mutual_reception_exalted == False
-    assert sun.dignities.mutual_reception_triplicity_ruler == True
-    assert sun.dignities.mutual_reception_term_ruler == False
-    assert sun.dignities.mutual_reception_face_ruler == False
-    assert sun.dignities.detriment == False
-    assert sun.dignities.fall == False
-    assert sun.dignities.peregrine == False
-    assert sun.dignities.formatted == [
-        names.DIGNITIES[dignities.MUTUAL_RECEPTION_TRIPLICITY_RULER],
-    ]
+    assert _public_vars(sun.dignities) == {
+        'ruler': False,
+        'exalted': False,
+        'triplicity_ruler': False,
+        'term_ruler': False,
+        'face_ruler': False,
+        'mutual_reception_ruler': False,
+        'mutual_reception_exalted': False,
+        'mutual_reception_triplicity_ruler': True,
+        'mutual_reception_term_ruler': False,
+        'mutual_reception_face_ruler': False,
+        'detriment': False,
+        'fall': False,
+        'peregrine': False,
+        'formatted': [
+            names.DIGNITIES[dignities.MUTUAL_RECEPTION_TRIPLICITY_RULER],
+        ],
+    }
 
     # EclipseType
     eclipse = natal_chart.objects[chart.PRE_NATAL_LUNAR_ECLIPSE]
-    assert eclipse.eclipse_type.total == False
-    assert eclipse.eclipse_type.annular == False
-    assert eclipse.eclipse_type.partial == True
-    assert eclipse.eclipse_type.annular_total == False
-    assert eclipse.eclipse_type.penumbral == False
-    assert eclipse.eclipse_type.formatted == names.ECLIPSE_TYPES[chart.PARTIAL]
+    assert _public_vars(eclipse.eclipse_type) == {
+        'total': False,
+        'annular': False,
+        'partial': True,
+        'annular_total': False,
+        'penumbral': False,
+        'formatted': names.ECLIPSE_TYPES[chart.PARTIAL],
+    }
 
     assert type(eclipse.date_time) is wrap.DateTime         # Tested separately, just ensure type
 
@@ -237,367 +483,146 @@ def test_wrapped_data(native):
     assert type(weightings.quadrants) is wrap.Quadrants     # Tested separately, just ensure type
 
     # Elements
-    elements = natal_chart.weightings.elements
+    elements = weightings.elements
     assert type(elements.fire) is list
     assert type(elements.earth) is list
     assert type(elements.air) is list
     assert type(elements.water) is list
 
     # Modalities
-    modalities = natal_chart.weightings.modalities
+    modalities = weightings.modalities
     assert type(modalities.cardinal) is list
     assert type(modalities.fixed) is list
     assert type(modalities.mutable) is list
 
     # Quadrants
-    quadrants = natal_chart.weightings.quadrants
+    quadrants = weightings.quadrants
     assert type(quadrants.first) is list
     assert type(quadrants.second) is list
     assert type(quadrants.third) is list
     assert type(quadrants.fourth) is list
 
 
-def test_natal(native, lat, lon):
-    natal_chart = charts.Natal(native)
-
-    assert natal_chart.type == names.CHART_TYPES[chart.NATAL]
-
-    assert round(natal_chart.native.date_time.julian + natal_chart.native.date_time.deltat, 6) == 2451545.250739
-    assert natal_chart.native.date_time.timezone == 'PST'
-
-    assert natal_chart.native.coordinates.latitude.formatted == lat
-    assert natal_chart.native.coordinates.longitude.formatted == lon
-
-    assert natal_chart.house_system == names.HOUSE_SYSTEMS[settings.house_system]
-    assert natal_chart.shape == names.CHART_SHAPES[calc.BOWL]
-    assert natal_chart.diurnal is True
-    assert natal_chart.moon_phase.third_quarter is True
-
-    # Spot-check for correct object positions against astro.com
-    assert natal_chart.objects[chart.SUN].name == names.PLANETS[chart.SUN]
-    assert natal_chart.objects[chart.SUN].sign.name == names.SIGNS[chart.CAPRICORN]
-    assert natal_chart.objects[chart.SUN].sign_longitude.formatted == '10°37\'26"'
-
-    assert natal_chart.objects[chart.MOON].name == names.PLANETS[chart.MOON]
-    assert natal_chart.objects[chart.MOON].sign.name == names.SIGNS[chart.SCORPIO]
-    assert natal_chart.objects[chart.MOON].sign_longitude.formatted == '16°19\'29"'
-
-    assert natal_chart.objects[chart.PART_OF_FORTUNE].name == names.POINTS[chart.PART_OF_FORTUNE]
-    assert natal_chart.objects[chart.PART_OF_FORTUNE].sign.name == names.SIGNS[chart.CAPRICORN]
-    assert natal_chart.objects[chart.PART_OF_FORTUNE].sign_longitude.formatted == '11°18\'41"'
-
+@mark.parametrize('chart_fixture, expected', CHARTS, ids=[chart_fixture for chart_fixture, _ in CHARTS])
+def test_chart(request, chart_fixture, expected, lat, lon):
+    chart_data = request.getfixturevalue(chart_fixture)
+    native = chart_data.native
+    weightings = chart_data.weightings
+    index, element, modality, quadrant = expected['weightings']
+
+    actual = {
+        'type': chart_data.type,
+        'julian': _jd(native.date_time),
+        'timezone': native.date_time.timezone,
+        'latitude': native.coordinates.latitude.formatted,
+        'longitude': native.coordinates.longitude.formatted,
+        'house_system': chart_data.house_system,
+        'shape': chart_data.shape if expected['shape'] is not None else None,
+        'diurnal': chart_data.diurnal,
+        'moon_phase': chart_data.moon_phase.formatted,
+        'sun_sign_longitude': chart_data.objects[chart.SUN].sign_longitude.formatted,
+        'element': index in getattr(weightings.elements, element),
+        'modality': index in getattr(weightings.modalities, modality),
+        'quadrant': index in getattr(weightings.quadrants, quadrant),
+    }
+
+    assert actual == {
+        'type': names.CHART_TYPES[expected['type']],
+        'julian': NATIVE_JD,
+        'timezone': 'PST',
+        'latitude': lat,
+        'longitude': lon,
+        'house_system': names.HOUSE_SYSTEMS[settings.house_system],
+        'shape': names.CHART_SHAPES[expected['shape']] if expected['shape'] is not None else None,
+        'diurnal': True,
+        'moon_phase': names.MOON_PHASES[expected['moon_phase']],
+        'sun_sign_longitude': expected['sun_sign_longitude'],
+        'element': True,
+        'modality': True,
+        'quadrant': True,
+    }
+
+    _assert_positions(chart_data.objects, expected['objects'])
+    _assert_positions(chart_data.houses, expected['houses'])
+    _assert_aspects(chart_data.aspects, expected['aspects'])
+
+
+def test_chart_epochs(natal_chart, solar_return_chart, progressed_chart, composite_chart):
+    # Chart-specific dates tested against astro.com, as (julian, timezone)
+    date_times = (
+        natal_chart.native.date_time,
+        solar_return_chart.solar_return_date_time,
+        progressed_chart.progressed_date_time,
+        composite_chart.partner.date_time,
+    )
+
+    assert tuple((_jd(date_time), date_time.timezone) for date_time in date_times) == (
+        (NATIVE_JD, 'PST'),
+        (SOLAR_RETURN_JD, 'PST'),
+        (PROGRESSED_JD, 'PST'),
+        (PARTNER_JD, 'PST'),
+    )
+
+
+def test_natal(natal_chart):
     # Spot-check for correct object data against astro.com & Astro Gold
-    assert natal_chart.objects[chart.SATURN].movement.retrograde is True
-    assert natal_chart.objects[chart.MARS].dignities.peregrine is True
-    assert natal_chart.objects[chart.MARS].score == -5
-
-    # Spot-check for correct angle positions against astro.com
-    assert natal_chart.objects[chart.ASC].name == names.ANGLES[chart.ASC]
-    assert natal_chart.objects[chart.ASC].sign.name == names.SIGNS[chart.PISCES]
-    assert natal_chart.objects[chart.ASC].sign_longitude.formatted == '05°36\'38"'
-
-    assert natal_chart.objects[chart.MC].name == names.ANGLES[chart.MC]
-    assert natal_chart.objects[chart.MC].sign.name == names.SIGNS[chart.SAGITTARIUS]
-    assert natal_chart.objects[chart.MC].sign_longitude.formatted == '14°50\'44"'
-
-    # Spot-check for correct 2nd house position against astro.com
-    assert natal_chart.houses[chart.HOUSE2].name == names.HOUSES[chart.HOUSE2]
-    assert natal_chart.houses[chart.HOUSE2].sign.name == names.SIGNS[chart.ARIES]
-    assert natal_chart.houses[chart.HOUSE2].sign_longitude.formatted == '17°59\'40"'
-
-    # Spot-check for correct aspects against astro.com
-    assert chart.SUN in natal_chart.aspects
-    assert chart.MOON in natal_chart.aspects[chart.SUN]
-    assert natal_chart.aspects[chart.SUN][chart.MOON].aspect == calc.SEXTILE
-
-    assert chart.MOON in natal_chart.aspects
-    assert chart.SATURN in natal_chart.aspects[chart.MOON]
-    assert natal_chart.aspects[chart.MOON][chart.SATURN].aspect == calc.OPPOSITION
-
-    # Spot-check for correct weightings against astro.com
-    assert chart.JUPITER in natal_chart.weightings.elements.fire
-    assert chart.JUPITER in natal_chart.weightings.modalities.cardinal
-    assert chart.JUPITER in natal_chart.weightings.quadrants.first
-
+    objects = natal_chart.objects
+    assert objects[chart.SATURN].movement.retrograde is True
+    assert objects[chart.MARS].dignities.peregrine is True
+    assert objects[chart.MARS].score == -5
 
-def test_solar_return(native, lat, lon, solar_return_year):
-    solar_return_chart = charts.SolarReturn(native, solar_return_year)
-
-    assert solar_return_chart.type == names.CHART_TYPES[chart.SOLAR_RETURN]
-
-    assert round(solar_return_chart.native.date_time.julian + solar_return_chart.native.date_time.deltat, 6) == 2451545.250739
-    assert solar_return_chart.native.date_time.timezone == 'PST'
-
-    assert round(solar_return_chart.solar_return_date_time.julian + solar_return_chart.solar_return_date_time.deltat, 6) == 2462502.521823
-    assert solar_return_chart.solar_return_date_time.timezone == 'PST'
-
-    assert solar_return_chart.native.coordinates.latitude.formatted == lat
-    assert solar_return_chart.native.coordinates.longitude.formatted == lon
-
-    assert solar_return_chart.house_system == names.HOUSE_SYSTEMS[settings.house_system]
-    assert solar_return_chart.shape == names.CHART_SHAPES[calc.LOCOMOTIVE]
-    assert solar_return_chart.diurnal is True
-    assert solar_return_chart.moon_phase.balsamic is True
-
-    # Spot-check for correct object positions against astro.com
-    assert solar_return_chart.objects[chart.SUN].name == names.PLANETS[chart.SUN]
-    assert solar_return_chart.objects[chart.SUN].sign.name == names.SIGNS[chart.CAPRICORN]
-    assert solar_return_chart.objects[chart.SUN].sign_longitude.formatted == '10°37\'26"'
-
-    assert solar_return_chart.objects[chart.MOON].name == names.PLANETS[chart.MOON]
-    assert solar_return_chart.objects[chart.MOON].sign.name == names.SIGNS[chart.SCORPIO]
-    assert solar_return_chart.objects[chart.MOON].sign_longitude.formatted == '28°43\'43"'
-
-    assert solar_return_chart.objects[chart.PART_OF_FORTUNE].name == names.POINTS[chart.PART_OF_FORTUNE]
-    assert solar_return_chart.objects[chart.PART_OF_FORTUNE].sign.name == names.SIGNS[chart.TAURUS]
-    assert solar_return_chart.objects[chart.PART_OF_FORTUNE].sign_longitude.formatted == '24°41\'28"'
 
+def test_solar_return(solar_return_chart):
     # Spot-check for correct object data against astro.com & Astro Gold
-    assert solar_return_chart.objects[chart.SATURN].movement.retrograde is True
-    assert solar_return_chart.objects[chart.MARS].dignities.peregrine is True
-    assert solar_return_chart.objects[chart.MARS].score == -5
-
-    # Spot-check for correct angle positions against astro.com
-    assert solar_return_chart.objects[chart.ASC].name == names.ANGLES[chart.ASC]
-    assert solar_return_chart.objects[chart.ASC].sign.name == names.SIGNS[chart.CANCER]
-    assert solar_return_chart.objects[chart.ASC].sign_longitude.formatted == '06°35\'11"'
-
-    assert solar_return_chart.objects[chart.MC].name == names.ANGLES[chart.MC]
-    assert solar_return_chart.objects[chart.MC].sign.name == names.SIGNS[chart.PISCES]
-    assert solar_return_chart.objects[chart.MC].sign_longitude.formatted == '20°21\'06"'
-
-    # Spot-check for correct 2nd house position against astro.com
-    assert solar_return_chart.houses[chart.HOUSE2].name == names.HOUSES[chart.HOUSE2]
-    assert solar_return_chart.houses[chart.HOUSE2].sign.name == names.SIGNS[chart.CANCER]
-    assert solar_return_chart.houses[chart.HOUSE2].sign_longitude.formatted == '28°17\'34"'
-
-    # Spot-check for correct aspects against astro.com
-    assert chart.SUN in solar_return_chart.aspects
-    assert chart.SATURN in solar_return_chart.aspects[chart.SUN]
-    assert solar_return_chart.aspects[chart.SUN][chart.SATURN].aspect == calc.TRINE
-
-    assert chart.MOON in solar_return_chart.aspects
-    assert chart.NEPTUNE in solar_return_chart.aspects[chart.MOON]
-    assert solar_return_chart.aspects[chart.MOON][chart.NEPTUNE].aspect == calc.TRINE
+    objects = solar_return_chart.objects
+    assert objects[chart.SATURN].movement.retrograde is True
+    assert objects[chart.MARS].dignities.peregrine is True
+    assert objects[chart.MARS].score == -5
 
-    # Spot-check for correct weightings against astro.com
-    assert chart.JUPITER in solar_return_chart.weightings.elements.water
-    assert chart.JUPITER in solar_return_chart.weightings.modalities.fixed
-    assert chart.JUPITER in solar_return_chart.weightings.quadrants.second
 
-
-def test_progressed(native, lat, lon, pdt):
-    settings.mc_progression_method = calc.NAIBOD
-    progressed_chart = charts.Progressed(native, pdt)
-
-    assert progressed_chart.type == names.CHART_TYPES[chart.PROGRESSED]
-    assert progressed_chart.progression_method == names.PROGRESSION_METHODS[settings.mc_progression_method]
-
-    assert round(progressed_chart.native.date_time.julian + progressed_chart.native.date_time.deltat, 6) == 2451545.250739
-    assert progressed_chart.native.date_time.timezone == 'PST'
+def test_progressed(progressed_chart):
+    assert progressed_chart.progression_method == names.PROGRESSION_METHODS[calc.NAIBOD]
 
     assert progressed_chart.progression_date_time.timezone == 'PDT'
     pdt_utc = progressed_chart.progression_date_time.datetime.astimezone(ZoneInfo('UTC'))
     assert (pdt_utc.year, pdt_utc.month, pdt_utc.day, pdt_utc.hour) == (2025, 6, 21, 0)
 
-    # Progressed date tested against astro.com
-    assert round(progressed_chart.progressed_date_time.julian + progressed_chart.progressed_date_time.deltat, 6) == 2451570.719456
-    assert progressed_chart.progressed_date_time.timezone == 'PST'
-
-    # Ensure coords have been converted back into correct string
-    assert progressed_chart.native.coordinates.latitude.formatted == lat
-    assert progressed_chart.native.coordinates.longitude.formatted == lon
-
-    assert progressed_chart.house_system == names.HOUSE_SYSTEMS[settings.house_system]
-    assert progressed_chart.shape == names.CHART_SHAPES[calc.LOCOMOTIVE]
-    assert progressed_chart.diurnal is True
-    assert progressed_chart.moon_phase.disseminating is True
-
-    # Spot-check for correct object positions against astro.com
-    assert progressed_chart.objects[chart.SUN].name == names.PLANETS[chart.SUN]
-    assert progressed_chart.objects[chart.SUN].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert progressed_chart.objects[chart.SUN].sign_longitude.formatted == '06°33\'41"'
-
-    assert progressed_chart.objects[chart.MOON].name == names.PLANETS[chart.MOON]
-    assert progressed_chart.objects[chart.MOON].sign.name == names.SIGNS[chart.LIBRA]
-    assert progressed_chart.objects[chart.MOON].sign_longitude.formatted == '23°50\'57"'
-
-    assert progressed_chart.objects[chart.PART_OF_FORTUNE].name == names.POINTS[chart.PART_OF_FORTUNE]
-    assert progressed_chart.objects[chart.PART_OF_FORTUNE].sign.name == names.SIGNS[chart.CAPRICORN]
-    assert progressed_chart.objects[chart.PART_OF_FORTUNE].sign_longitude.formatted == '00°17\'45"'
-
     # Spot-check for correct object data against Astro Gold
-    assert progressed_chart.objects[chart.SUN].dignities.detriment is True
-    assert progressed_chart.objects[chart.SUN].dignities.peregrine is True
-    assert progressed_chart.objects[chart.SUN].score == -10
-
-    # Spot-check for correct angle positions against astro.com
-    assert progressed_chart.objects[chart.ASC].name == names.ANGLES[chart.ASC]
-    assert progressed_chart.objects[chart.ASC].sign.name == names.SIGNS[chart.ARIES]
-    assert progressed_chart.objects[chart.ASC].sign_longitude.formatted == '13°00\'29"'
-
-    assert progressed_chart.objects[chart.MC].name == names.ANGLES[chart.MC]
-    assert progressed_chart.objects[chart.MC].sign.name == names.SIGNS[chart.CAPRICORN]
-    assert progressed_chart.objects[chart.MC].sign_longitude.formatted == '07°57\'07"'
-
-    # Spot-check for correct 2nd house position against astro.com
-    assert progressed_chart.houses[chart.HOUSE2].name == names.HOUSES[chart.HOUSE2]
-    assert progressed_chart.houses[chart.HOUSE2].sign.name == names.SIGNS[chart.TAURUS]
-    assert progressed_chart.houses[chart.HOUSE2].sign_longitude.formatted == '18°52\'16"'
-
-    # Spot-check for correct aspects against astro.com
-    assert chart.SUN in progressed_chart.aspects
-    assert chart.SATURN in progressed_chart.aspects[chart.SUN]
-    assert progressed_chart.aspects[chart.SUN][chart.SATURN].aspect == calc.SQUARE
+    sun = progressed_chart.objects[chart.SUN]
+    assert sun.dignities.detriment is True
+    assert sun.dignities.peregrine is True
+    assert sun.score == -10
 
-    assert chart.MOON in progressed_chart.aspects
-    assert chart.URANUS in progressed_chart.aspects[chart.MOON]
-    assert progressed_chart.aspects[chart.MOON][chart.URANUS].aspect == calc.TRINE
 
-    # Spot-check for correct weightings against astro.com
-    assert chart.VENUS in progressed_chart.weightings.elements.earth
-    assert chart.VENUS in progressed_chart.weightings.modalities.cardinal
-    assert chart.VENUS in progressed_chart.weightings.quadrants.third
-
-
-def test_composite(native, lat, lon, partner, partner_lat, partner_lon):
-    composite_chart = charts.Composite(native, partner)
-
-    assert composite_chart.type == names.CHART_TYPES[chart.COMPOSITE]
-
-    assert round(composite_chart.native.date_time.julian + composite_chart.native.date_time.deltat, 6) == 2451545.250739
-    assert composite_chart.native.date_time.timezone == 'PST'
-
-    assert round(composite_chart.partner.date_time.julian + composite_chart.partner.date_time.deltat, 6) == 2451957.084075
-    assert composite_chart.partner.date_time.timezone == 'PST'
-
-    assert composite_chart.native.coordinates.latitude.formatted == lat
-    assert composite_chart.native.coordinates.longitude.formatted == lon
-
-    assert composite_chart.partner.coordinates.latitude.formatted == partner_lat
-    assert composite_chart.partner.coordinates.longitude.formatted == partner_lon
-
-    assert composite_chart.house_system == names.HOUSE_SYSTEMS[settings.house_system]
-    assert composite_chart.diurnal is True
-    assert composite_chart.moon_phase.third_quarter is True
-
-    # Spot-check for correct object positions against astro.com
-    assert composite_chart.objects[chart.ASC].name == names.ANGLES[chart.ASC]
-    assert composite_chart.objects[chart.ASC].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert composite_chart.objects[chart.ASC].sign_longitude.formatted == '21°26\'55"'
-
-    assert composite_chart.objects[chart.SUN].name == names.PLANETS[chart.SUN]
-    assert composite_chart.objects[chart.SUN].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert composite_chart.objects[chart.SUN].sign_longitude.formatted == '04°17\'35"'
-
-    assert composite_chart.objects[chart.MOON].name == names.PLANETS[chart.MOON]
-    assert composite_chart.objects[chart.MOON].sign.name == names.SIGNS[chart.SAGITTARIUS]
-    assert composite_chart.objects[chart.MOON].sign_longitude.formatted == '00°22\'35"'
-
-    assert composite_chart.objects[chart.PART_OF_FORTUNE].name == names.POINTS[chart.PART_OF_FORTUNE]
-    assert composite_chart.objects[chart.PART_OF_FORTUNE].sign.name == names.SIGNS[chart.PISCES]
-    assert composite_chart.objects[chart.PART_OF_FORTUNE].sign_longitude.formatted == '01°03\'58"'
+def test_composite(composite_chart, partner_lat, partner_lon):
+    composite_partner = composite_chart.partner
+    assert composite_partner.coordinates.latitude.formatted == partner_lat
+    assert composite_partner.coordinates.longitude.formatted == partner_lon
 
     # Spot-check for correct object data against Astro Gold
-    assert composite_chart.objects[chart.SUN].dignities.detriment is True
-    assert composite_chart.objects[chart.SUN].dignities.peregrine is True
-    assert composite_chart.objects[chart.SUN].score == -10
-
-    # Spot-check for correct angle positions against astro.com
-    assert composite_chart.objects[chart.ASC].name == names.ANGLES[chart.ASC]
-    assert composite_chart.objects[chart.ASC].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert composite_chart.objects[chart.ASC].sign_longitude.formatted == '21°26\'55"'
+    sun = composite_chart.objects[chart.SUN]
+    assert sun.dignities.detriment is True
+    assert sun.dignities.peregrine is True
+    assert sun.score == -10
 
-    assert composite_chart.objects[chart.MC].name == names.ANGLES[chart.MC]
-    assert composite_chart.objects[chart.MC].sign.name == names.SIGNS[chart.SAGITTARIUS]
-    assert composite_chart.objects[chart.MC].sign_longitude.formatted == '06°07\'28"'
-
-    # Spot-check for correct 2nd house position against astro.com
-    assert composite_chart.houses[chart.HOUSE2].name == names.HOUSES[chart.HOUSE2]
-    assert composite_chart.houses[chart.HOUSE2].sign.name == names.SIGNS[chart.ARIES]
-    assert composite_chart.houses[chart.HOUSE2].sign_longitude.formatted == '05°32\'57"'
-
-    # Spot-check for correct aspects against astro.com
-    assert chart.SUN in composite_chart.aspects
-    assert chart.MOON in composite_chart.aspects[chart.SUN]
-    assert composite_chart.aspects[chart.SUN][chart.MOON].aspect == calc.SEXTILE
-
-    assert chart.MOON in composite_chart.aspects
-    assert chart.VENUS in composite_chart.aspects[chart.MOON]
-    assert composite_chart.aspects[chart.MOON][chart.VENUS].aspect == calc.SEXTILE
-
-    # Spot-check for correct weightings against astro.com
-    assert chart.JUPITER in composite_chart.weightings.elements.earth
-    assert chart.JUPITER in composite_chart.weightings.modalities.fixed
-    assert chart.JUPITER in composite_chart.weightings.quadrants.first
 
+@mark.parametrize('house_system, expected', COMPOSITE_HOUSE_SYSTEMS.items(), ids=[names.HOUSE_SYSTEMS[house_system] for house_system in COMPOSITE_HOUSE_SYSTEMS])
+def test_composite_house_system(native, partner, house_system, expected):
     # Ensure more quirky house systems work
-    settings.house_system = chart.EQUAL
-
+    settings.house_system = house_system
     composite_chart = charts.Composite(native, partner)
+    items = {**composite_chart.objects, **composite_chart.houses}
 
-    assert composite_chart.objects[chart.ASC].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert composite_chart.objects[chart.ASC].sign_longitude.formatted == '21°26\'55"'
-    assert composite_chart.objects[chart.ASC].declination.formatted == '-14°21\'10"'
-
-    assert composite_chart.objects[chart.MC].sign.name == names.SIGNS[chart.SAGITTARIUS]
-    assert composite_chart.objects[chart.MC].sign_longitude.formatted == '06°07\'28"'
-    assert composite_chart.objects[chart.MC].declination.formatted == '-21°19\'44"'
-
-    assert composite_chart.houses[chart.HOUSE1].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert composite_chart.houses[chart.HOUSE1].sign_longitude.formatted == '21°26\'55"'
-    assert composite_chart.houses[chart.HOUSE1].declination.formatted == '-14°21\'10"'
-
-    assert composite_chart.houses[chart.HOUSE2].sign.name == names.SIGNS[chart.PISCES]
-    assert composite_chart.houses[chart.HOUSE2].sign_longitude.formatted == '21°26\'55"'
-    assert composite_chart.houses[chart.HOUSE2].declination.formatted == '-03°23\'27"'
-
-    settings.house_system = chart.VEHLOW_EQUAL
-
-    composite_chart = charts.Composite(native, partner)
-
-    assert composite_chart.objects[chart.ASC].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert composite_chart.objects[chart.ASC].sign_longitude.formatted == '21°26\'55"'
-    assert composite_chart.objects[chart.ASC].declination.formatted == '-14°21\'10"'
-
-    assert composite_chart.objects[chart.MC].sign.name == names.SIGNS[chart.SAGITTARIUS]
-    assert composite_chart.objects[chart.MC].sign_longitude.formatted == '06°07\'28"'
-    assert composite_chart.objects[chart.MC].declination.formatted == '-21°19\'44"'
-
-    assert composite_chart.houses[chart.HOUSE1].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert composite_chart.houses[chart.HOUSE1].sign_longitude.formatted == '06°26\'55"'
-    assert composite_chart.houses[chart.HOUSE1].declination.formatted == '-18°39\'36"'
+    assert {
+        index: (items[index].sign.name, items[index].sign_longitude.formatted, items[index].declination.formatted)
+        for index in expected
+    } == {
+        index: (names.SIGNS[sign], sign_longitude, declination)
+        for index, (sign, sign_longitude, declination) in expected.items()
+    }
 
-    assert composite_chart.houses[chart.HOUSE2].sign.name == names.SIGNS[chart.PISCES]
-    assert composite_chart.houses[chart.HOUSE2].sign_longitude.formatted == '06°26\'55"'
-    assert composite_chart.houses[chart.HOUSE2].declination.formatted == '-09°08\'42"'
-
-    settings.house_system = chart.WHOLE_SIGN
-
-    composite_chart = charts.Composite(native, partner)
-
-    assert composite_chart.objects[chart.ASC].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert composite_chart.objects[chart.ASC].sign_longitude.formatted == '21°26\'55"'
-    assert composite_chart.objects[chart.ASC].declination.formatted == '-14°21\'10"'
-
-    assert composite_chart.objects[chart.MC].sign.name == names.SIGNS[chart.SAGITTARIUS]
-    assert composite_chart.objects[chart.MC].sign_longitude.formatted == '06°07\'28"'
-    assert composite_chart.objects[chart.MC].declination.formatted == '-21°19\'44"'
-
-    assert composite_chart.houses[chart.HOUSE1].sign.name == names.SIGNS[chart.AQUARIUS]
-    assert composite_chart.houses[chart.HOUSE1].sign_longitude.formatted == '00°00\'00"'
-    assert composite_chart.houses[chart.HOUSE1].declination.formatted == '-20°08\'58"'
-
-    assert composite_chart.houses[chart.HOUSE2].sign.name == names.SIGNS[chart.PISCES]
-    assert composite_chart.houses[chart.HOUSE2].sign_longitude.formatted == '00°00\'00"'
-    assert composite_chart.houses[chart.HOUSE2].declination.formatted == '-11°28\'17"'
-
-    settings.house_system = chart.PLACIDUS
-
-
-def test_transits(lat, lon):
-    transits_chart = charts.Transits(lat, lon)
 
+def test_transits(transits_chart, lat, lon):
     assert transits_chart.type == names.CHART_TYPES[chart.TRANSITS]
 
     assert transits_chart.native.coordinates.latitude.formatted == lat
@@ -605,28 +630,35 @@ def test_transits(lat, lon):
 
     assert transits_chart.house_system == names.HOUSE_SYSTEMS[settings.house_system]
 
-    default_transits_chart = charts.Transits()
 
-    assert default_transits_chart.native.coordinates.latitude.raw == settings.default_latitude
-    assert default_transits_chart.native.coordinates.longitude.raw == settings.default_longitude
+def test_transits_default_coordinates(partner_lat, partner_lon):
+    # Defaults are read from settings at call time
+    settings.default_latitude = partner_lat
+    settings.default_longitude = partner_lon
+    coordinates = charts.Transits().native.coordinates
 
+    assert (coordinates.latitude.formatted, coordinates.longitude.formatted) == (partner_lat, partner_lon)
 
-def test_synastry(native, partner):
-    partner_chart = charts.Natal(partner)
-    native_chart = charts.Natal(native, aspects_to=partner_chart)
 
-    # Spot-check for correct aspects against astro.com
-    assert chart.SUN in native_chart.aspects
-    assert chart.VENUS in native_chart.aspects[chart.SUN]
-    assert native_chart.aspects[chart.SUN][chart.VENUS].aspect == calc.SQUARE
+def test_synastry(synastry_chart, partner_natal_chart):
+    native_chart = synastry_chart
 
-    assert chart.MOON in native_chart.aspects
-    assert chart.MERCURY in native_chart.aspects[chart.MOON]
-    assert native_chart.aspects[chart.MOON][chart.MERCURY].aspect == calc.SQUARE
+    # Aspecting another chart must not move the native's own positions
+    _assert_positions(native_chart.objects, NATAL['objects'])
+    _assert_positions(native_chart.houses, NATAL['houses'])
+
+    # Spot-check for correct aspects against astro.com
+    _assert_aspects(native_chart.aspects, {
+        (chart.SUN, chart.VENUS): calc.SQUARE,
+        (chart.MOON, chart.MERCURY): calc.SQUARE,
+    })
 
     # Spot-check house_for() against astro.com
-    assert native_chart.house_for(partner_chart.objects[chart.SUN]) == chart.HOUSE12
-    assert partner_chart.house_for(native_chart.objects[chart.SUN]) == chart.HOUSE11
+    objects = native_chart.objects
+    partner_objects = partner_natal_chart.objects
+
+    assert native_chart.house_for(partner_objects[chart.SUN]) == chart.HOUSE12
+    assert partner_natal_chart.house_for(objects[chart.SUN]) == chart.HOUSE11
 
-    assert native_chart.house_for(partner_chart.objects[chart.MOON]) == chart.HOUSE9
-    assert partner_chart.house_for(native_chart.objects[chart.MOON]) == chart.HOUSE9
+    assert native_chart.house_for(partner_objects[chart.MOON]) == chart.HOUSE9
+    assert partner_natal_chart.house_for(objects[chart.MOON]) == chart.HOUSE9
@@ -195,6 +195,10 @@ def test_objects(jd, coords):
     chart_objects = (chart.SUN, chart.MOON, chart.PART_OF_FORTUNE, chart.SYZYGY, chart.NORTH_NODE, chart.ASC)
     objects = ephemeris.objects(chart_objects, jd, *coords, chart.PLACIDUS, calc.DAY_NIGHT_FORMULA)
     assert tuple(objects.keys()) == chart_objects
+    # Lists are accepted, and altering a result does not affect later calls
+    objects.pop(chart.SUN)
+    assert ephemeris.objects(list(chart_objects), jd, *coords, chart.PLACIDUS, calc.DAY_NIGHT_FORMULA) == ephemeris.objects(chart_objects, jd, *coords, chart.PLACIDUS, calc.DAY_NIGHT_FORMULA)
+    assert tuple(ephemeris.objects(chart_objects, jd, *coords, chart.PLACIDUS, calc.DAY_NIGHT_FORMULA).keys()) == chart_objects
 
 
 def test_armc_objects(jd, coords, armc):